@@ -1,9 +1,12 @@
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Tuple
+
+import orjson
 
 HEADERS: Dict[str, str] = {
     "accept": "application/json",
     "accept-language": "en-IN,en-GB;q=0.9,en;q=0.8,en-US;q=0.7",
+    "connection": "keep-alive",
     "content-type": "text/plain;charset=UTF-8",
     "origin": "https://in.tradingview.com",
     "referer": "https://in.tradingview.com/",
@@ -14,7 +17,7 @@ PARAMS: Dict[str, str] = {
     "label-product": "screener-stock",
 }
 
-BASIC_INFO_COLUMNS: List[str] = [
+BASIC_INFO_COLUMNS: Tuple[str, ...] = (
     "name",
     "description",
     "logoid",
@@ -31,9 +34,9 @@ BASIC_INFO_COLUMNS: List[str] = [
     "minmov",
     "fractional",
     "minmove2",
-]
+)
 
-PRICE_COLUMNS: List[str] = [
+PRICE_COLUMNS: Tuple[str, ...] = (
     "open",
     "high",
     "low",
@@ -47,25 +50,25 @@ PRICE_COLUMNS: List[str] = [
     "postmarket_high",
     "postmarket_low",
     "postmarket_close",
-]
+)
 
-VOLUME_COLUMNS: List[str] = [
+VOLUME_COLUMNS: Tuple[str, ...] = (
     "volume",
     "relative_volume_10d_calc",
     "relative_volume_10d_calc|1W",
     "average_volume_10d_calc",
     "average_volume_30d_calc",
-]
+)
 
-FUNDAMENTAL_COLUMNS: List[str] = [
+FUNDAMENTAL_COLUMNS: Tuple[str, ...] = (
     "market_cap_basic",
     "price_earnings_ttm",
     "earnings_per_share_diluted_ttm",
     "earnings_per_share_diluted_yoy_growth_ttm",
     "dividends_yield_current",
-]
+)
 
-TECHNICAL_COLUMNS: List[str] = [
+TECHNICAL_COLUMNS: Tuple[str, ...] = (
     "SMA20",
     "SMA50",
     "SMA100",
@@ -81,18 +84,18 @@ TECHNICAL_COLUMNS: List[str] = [
     "ATR",
     "Pivot.M.Classic.R1",
     "Pivot.M.Classic.S1",
-]
+)
 
-PERFORMANCE_COLUMNS: List[str] = [
+PERFORMANCE_COLUMNS: Tuple[str, ...] = (
     "change",
     "gap",
     "Perf.W",
     "Perf.1M",
     "Perf.3M",
     "beta_1_year",
-]
+)
 
-CANDLESTICK_COLUMNS: List[str] = [
+CANDLESTICK_COLUMNS: Tuple[str, ...] = (
     "Candle.3BlackCrows",
     "Candle.3WhiteSoldiers",
     "Candle.AbandonedBaby.Bearish",
@@ -120,108 +123,28 @@ CANDLESTICK_COLUMNS: List[str] = [
     "Candle.SpinningTop.White",
     "Candle.TriStar.Bearish",
     "Candle.TriStar.Bullish",
-]
+)
 
-RECOMMENDATION_COLUMNS: List[str] = [
+RECOMMENDATION_COLUMNS: Tuple[str, ...] = (
     "recommendation_mark",
     "Recommend.All",
-]
+)
 
-COLUMNS: List[str] = [
-    "name",
-    "description",
-    "logoid",
-    "update_mode",
-    "type",
-    "typespecs",
-    "close",
-    "pricescale",
-    "minmov",
-    "fractional",
-    "minmove2",
-    "currency",
-    "change",
-    "volume",
-    "relative_volume_10d_calc",
-    "market_cap_basic",
-    "fundamental_currency_code",
-    "price_earnings_ttm",
-    "earnings_per_share_diluted_ttm",
-    "earnings_per_share_diluted_yoy_growth_ttm",
-    "dividends_yield_current",
-    "sector.tr",
-    "market",
-    "sector",
-    "recommendation_mark",
-    "open",
-    "high",
-    "low",
-    "VWAP",
-    "premarket_open",
-    "premarket_high",
-    "premarket_low",
-    "premarket_close",
-    "postmarket_open",
-    "postmarket_high",
-    "postmarket_low",
-    "postmarket_close",
-    "SMA20",
-    "SMA50",
-    "SMA100",
-    "EMA20",
-    "EMA50",
-    "EMA200",
-    "RSI",
-    "MACD.macd",
-    "MACD.signal",
-    "BB.upper",
-    "BB.basis",
-    "BB.lower",
-    "ATR",
-    "gap",
-    "Pivot.M.Classic.R1",
-    "Pivot.M.Classic.S1",
-    "Perf.W",
-    "Perf.1M",
-    "Perf.3M",
-    "beta_1_year",
-    "relative_volume_10d_calc|1W",
-    "average_volume_10d_calc",
-    "average_volume_30d_calc",
-    "Candle.3BlackCrows",
-    "Candle.3WhiteSoldiers",
-    "Candle.AbandonedBaby.Bearish",
-    "Candle.AbandonedBaby.Bullish",
-    "Candle.Doji",
-    "Candle.Doji.Dragonfly",
-    "Candle.Doji.Gravestone",
-    "Candle.Engulfing.Bearish",
-    "Candle.Engulfing.Bullish",
-    "Candle.EveningStar",
-    "Candle.Hammer",
-    "Candle.HangingMan",
-    "Candle.Harami.Bearish",
-    "Candle.Harami.Bullish",
-    "Candle.InvertedHammer",
-    "Candle.Kicking.Bearish",
-    "Candle.Kicking.Bullish",
-    "Candle.LongShadow.Lower",
-    "Candle.LongShadow.Upper",
-    "Candle.Marubozu.Black",
-    "Candle.Marubozu.White",
-    "Candle.MorningStar",
-    "Candle.ShootingStar",
-    "Candle.SpinningTop.Black",
-    "Candle.SpinningTop.White",
-    "Candle.TriStar.Bearish",
-    "Candle.TriStar.Bullish",
-    "exchange",
-    "Recommend.All",
-]
+# Full scan column set, composed from the groups above
+COLUMNS: Tuple[str, ...] = (
+    *BASIC_INFO_COLUMNS,
+    *PRICE_COLUMNS,
+    *VOLUME_COLUMNS,
+    *FUNDAMENTAL_COLUMNS,
+    *TECHNICAL_COLUMNS,
+    *PERFORMANCE_COLUMNS,
+    *CANDLESTICK_COLUMNS,
+    *RECOMMENDATION_COLUMNS,
+)
 
-SYMBOLS: List[str] = ["SYML:NSE;NIFTY", "SYML:NSE;NIFTYJR"]
+SYMBOLS: Tuple[str, ...] = ("SYML:NSE;NIFTY", "SYML:NSE;NIFTYJR")
 
-MARKETS: List[str] = ["india"]
+MARKETS: Tuple[str, ...] = ("india",)
 
 DATA: Dict[str, Any] = {
     "columns": COLUMNS,
@@ -230,6 +153,9 @@ DATA: Dict[str, Any] = {
     "markets": MARKETS,
 }
 
+# Request body serialized once, since DATA never changes at runtime
+DATA_JSON: bytes = orjson.dumps(DATA)
+
 RECOMMENDATION_THRESHOLDS: dict[str, Any] = {
     "strong_sell": (-1, -0.5),
     "sell": (-0.5, -0.1),
@@ -238,6 +164,17 @@ RECOMMENDATION_THRESHOLDS: dict[str, Any] = {
     "strong_buy": (0.5, 1),
 }
 
+# Bin edges and labels matching RECOMMENDATION_THRESHOLDS, for use with pd.cut
+RECOMMENDATION_BINS: Tuple[float, ...] = (-1.0, -0.5, -0.1, 0.1, 0.5, 1.0)
+
+RECOMMENDATION_LABELS: Tuple[str, ...] = (
+    "strong_sell",
+    "sell",
+    "neutral",
+    "buy",
+    "strong_buy",
+)
+
 API_URL: str = "https://scanner.tradingview.com/india/scan"
 
 TEMP_DIR = Path("tempDir")
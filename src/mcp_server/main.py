@@ -1,26 +1,34 @@
 import datetime
-import json
+import functools
 import logging
+import threading
+from operator import methodcaller
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from mcp.server.fastmcp import FastMCP
+from requests.adapters import HTTPAdapter
 
 from mcp_server.constants import (
     API_URL,
     BASIC_INFO_COLUMNS,
     CANDLESTICK_COLUMNS,
     COLUMNS,
-    DATA,
+    DATA_JSON,
     FUNDAMENTAL_COLUMNS,
     HEADERS,
     PARAMS,
     PERFORMANCE_COLUMNS,
     PRICE_COLUMNS,
+    RECOMMENDATION_BINS,
     RECOMMENDATION_COLUMNS,
-    RECOMMENDATION_THRESHOLDS,
+    RECOMMENDATION_LABELS,
     TECHNICAL_COLUMNS,
     TEMP_DIR,
     VOLUME_COLUMNS,
@@ -31,7 +39,35 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 mcp = FastMCP("Tradingview_mcp")
-TEMP_FILE = TEMP_DIR / f"{datetime.datetime.now().date().strftime('%Y-%m-%d')}.csv"
+
+# Shared HTTP session so repeated scans reuse the pooled TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Fetches a row's "d" cells in C, returning None when the key is missing
+_get_row_cells = methodcaller("get", "d")
+
+# Position of each column in the scanner's response rows
+_COLUMN_INDEX: Dict[str, int] = {column: i for i, column in enumerate(COLUMNS)}
+
+_COLUMN_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "basic_info": BASIC_INFO_COLUMNS,
+    "price": PRICE_COLUMNS,
+    "volume": VOLUME_COLUMNS,
+    "fundamental": FUNDAMENTAL_COLUMNS,
+    "technical": TECHNICAL_COLUMNS,
+    "performance": PERFORMANCE_COLUMNS,
+    "candlestick": CANDLESTICK_COLUMNS,
+    "recommendation": RECOMMENDATION_COLUMNS,
+}
+
+_CATEGORIES: Tuple[str, ...] = (*RECOMMENDATION_LABELS, "unknown")
+
+# Category for each np.searchsorted position over RECOMMENDATION_BINS
+_CATEGORY_LOOKUP = np.array(
+    ["unknown", *RECOMMENDATION_LABELS, "unknown"], dtype=object
+)
 
 
 class TradingViewError(Exception):
@@ -59,9 +95,17 @@ def categorize_recommendation(value: Union[float, int, Any]) -> str:
     if not isinstance(value, (int, float)) or pd.isna(value):
         return "unknown"
 
-    for category, (min_value, max_value) in RECOMMENDATION_THRESHOLDS.items():
-        if min_value <= value <= max_value:
-            return category
+    # Bounds mirror RECOMMENDATION_THRESHOLDS; shared edges go to the lower bucket
+    if -0.1 < value <= 0.1:
+        return "neutral"
+    if 0.1 < value <= 0.5:
+        return "buy"
+    if -0.5 < value <= -0.1:
+        return "sell"
+    if 0.5 < value <= 1:
+        return "strong_buy"
+    if -1 <= value <= -0.5:
+        return "strong_sell"
 
     return "unknown"
 
@@ -78,20 +122,19 @@ def _make_api_request() -> Dict[str, Any]:
     """
     try:
         logger.info("Fetching data from TradingView API")
-        response = requests.post(
+        response = _SESSION.post(
             API_URL,
             params=PARAMS,
-            data=json.dumps(DATA),
-            headers=HEADERS,
+            data=DATA_JSON,
             timeout=30,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     except requests.exceptions.RequestException as e:
         logger.error(f"API request failed: {e}")
         raise TradingViewError(f"API request failed: {e}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON response: {e}")
         raise TradingViewError(f"Invalid JSON response: {e}")
 
@@ -113,13 +156,55 @@ def _extract_data_rows(api_response: Dict[str, Any]) -> List[List[Any]]:
     if not api_data:
         raise TradingViewError("Unable to find the 'data' key in API response")
 
-    api_rows = [row.get("d") for row in api_data if row.get("d") is not None]
+    api_rows = [cells for cells in map(_get_row_cells, api_data) if cells is not None]
     if not api_rows:
         raise TradingViewError("Unable to find row data in API response")
 
     return api_rows
 
 
+def _parse_rows_columnar(
+    api_rows: List[List[Any]], needed_cols: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Transpose raw API rows into one array per requested column.
+
+    Args:
+        api_rows: Raw data rows from API, ordered as COLUMNS
+        needed_cols: Columns to materialize
+
+    Returns:
+        Mapping of column name to an object array of its cells
+    """
+    cells_by_column = list(zip(*api_rows))
+
+    return {
+        column: np.fromiter(
+            cells_by_column[_COLUMN_INDEX[column]], dtype=object, count=len(api_rows)
+        )
+        for column in needed_cols
+    }
+
+
+def _categorize_recommendations(values: np.ndarray) -> np.ndarray:
+    """
+    Categorize an array of recommendation values in a single vectorized pass.
+
+    Args:
+        values: Raw "Recommend.All" values
+
+    Returns:
+        Array of category names, with "unknown" for missing or out-of-range values
+    """
+    numeric = pd.to_numeric(values, errors="coerce").astype(float)
+
+    # Bins are right-closed, but the lowest edge still belongs to the first bin
+    positions = np.searchsorted(RECOMMENDATION_BINS, numeric, side="left")
+    positions[numeric == RECOMMENDATION_BINS[0]] = 1
+
+    return _CATEGORY_LOOKUP[positions]
+
+
 def _process_dataframe(api_rows: List[List[Any]]) -> pd.DataFrame:
     """
     Process raw API data into a pandas DataFrame.
@@ -130,30 +215,74 @@ def _process_dataframe(api_rows: List[List[Any]]) -> pd.DataFrame:
     Returns:
         Processed DataFrame with recommendation categories
     """
-    df = pd.DataFrame(api_rows, columns=COLUMNS)
+    columns = _parse_rows_columnar(api_rows, COLUMNS)
 
-    # Add recommendation category column
-    df["recommendation_category"] = df["Recommend.All"].apply(categorize_recommendation)  # type: ignore
+    df = pd.DataFrame(columns, copy=False).infer_objects()
+
+    # Add recommendation category column, stored as a Categorical for cheap filtering
+    df["recommendation_category"] = pd.Categorical(
+        _categorize_recommendations(columns["Recommend.All"]),
+        categories=_CATEGORIES,
+    )
 
     return df
 
 
-def _save_to_csv(df: pd.DataFrame, file_path: Path) -> None:
+@functools.lru_cache(maxsize=4)
+def _temp_file_for(date_str: str) -> Path:
+    """
+    Get the snapshot path for a given day.
+
+    Args:
+        date_str: ISO date the snapshot belongs to
+
+    Returns:
+        Path of the day's Parquet file
+    """
+    return TEMP_DIR / f"{date_str}.parquet"
+
+
+def _save_to_parquet(df: pd.DataFrame, file_path: Path) -> None:
     """
-    Save DataFrame to CSV file.
+    Save DataFrame to a Parquet file.
 
     Args:
         df: DataFrame to save
         file_path: Path to save the file
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(file_path, index=False)
+
+    # Write to a sibling file first so readers never see a partial snapshot
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+    tmp_path.replace(file_path)
     logger.info(f"Data saved to {file_path}")
 
 
-def fetch_trading_view_data() -> None:
+def _save_to_parquet_in_background(df: pd.DataFrame, file_path: Path) -> None:
+    """
+    Save DataFrame to a Parquet file from a daemon thread.
+
+    Args:
+        df: DataFrame to save, which must not be mutated while the write runs
+        file_path: Path to save the file
+    """
+
+    def _save() -> None:
+        try:
+            _save_to_parquet(df, file_path)
+        except Exception as e:
+            logger.error(f"Failed to save data to {file_path}: {e}")
+
+    threading.Thread(target=_save, daemon=True).start()
+
+
+def _fetch_dataframe() -> pd.DataFrame:
     """
-    Fetch trading data from TradingView API and save it to a CSV file.
+    Fetch trading data from TradingView API into a DataFrame.
+
+    Returns:
+        Processed DataFrame with recommendation categories
 
     Raises:
         TradingViewError: If any step in the process fails
@@ -166,10 +295,7 @@ def fetch_trading_view_data() -> None:
         api_rows = _extract_data_rows(api_response)
 
         # Process into DataFrame
-        df = _process_dataframe(api_rows)
-
-        # Save to CSV
-        _save_to_csv(df, TEMP_FILE)
+        return _process_dataframe(api_rows)
 
     except TradingViewError:
         raise
@@ -178,9 +304,55 @@ def fetch_trading_view_data() -> None:
         raise TradingViewError(f"Unexpected error during data fetch: {e}")
 
 
-def _load_data() -> pd.DataFrame:
+@functools.lru_cache(maxsize=1)
+def _fetch_dataframe_cached(date_str: str) -> pd.DataFrame:
+    """
+    Fetch the day's data once and start persisting it in the background.
+
+    Callers arriving before the background write finishes reuse this frame
+    instead of fetching again. It is shared and must be treated as read-only.
+
+    Args:
+        date_str: ISO date the data belongs to, used as the cache key
+
+    Returns:
+        Processed DataFrame with recommendation categories
+
+    Raises:
+        TradingViewError: If any step in the fetch fails
+    """
+    df = _fetch_dataframe()
+    _save_to_parquet_in_background(df, _temp_file_for(date_str))
+    return df
+
+
+def fetch_trading_view_data() -> None:
+    """
+    Fetch trading data from TradingView API and save it to a Parquet file.
+
+    Raises:
+        TradingViewError: If any step in the process fails
+    """
+    df = _fetch_dataframe()
+    file_path = _temp_file_for(datetime.date.today().isoformat())
+
+    try:
+        _save_to_parquet(df, file_path)
+    except Exception as e:
+        logger.error(f"Failed to save data to {file_path}: {e}")
+        raise TradingViewError(f"Failed to save data to file: {e}")
+
+
+def _load_data(date_str: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
     """
-    Load data from CSV file, fetching if necessary.
+    Load data from the Parquet file, fetching if necessary.
+
+    Freshly fetched data is returned directly and persisted in the background,
+    so the first call of the day does not read back what it just wrote.
+
+    Args:
+        date_str: ISO date of the data to load
+        columns: Columns to read from the file, or None to read all of them
 
     Returns:
         DataFrame with trading data
@@ -188,17 +360,95 @@ def _load_data() -> pd.DataFrame:
     Raises:
         TradingViewError: If data loading fails
     """
-    if not TEMP_FILE.exists():
+    file_path = _temp_file_for(date_str)
+    selected_columns = list(dict.fromkeys(columns)) if columns is not None else None
+
+    if not file_path.exists():
         logger.info("Temporary file not found, fetching fresh data")
-        fetch_trading_view_data()
+        df = _fetch_dataframe_cached(date_str)
+        return df if selected_columns is None else df[selected_columns]
 
     try:
-        return pd.read_csv(TEMP_FILE)  # type: ignore
+        table = pq.read_table(file_path, columns=selected_columns)
+        df = table.to_pandas()
+
+        # Arrow hands list cells back as NumPy arrays; restore the plain lists the
+        # API returned so records stay JSON-serializable
+        for field in table.schema:
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+                df[field.name] = pd.Series(
+                    table.column(field.name).to_pylist(), index=df.index, dtype=object
+                )
+
+        return df
     except Exception as e:
-        logger.error(f"Failed to load data from {TEMP_FILE}: {e}")
+        logger.error(f"Failed to load data from {file_path}: {e}")
         raise TradingViewError(f"Failed to load data from file: {e}")
 
 
+@functools.lru_cache(maxsize=16)
+def _load_data_cached(
+    date_str: str, columns: Optional[Tuple[str, ...]] = None
+) -> pd.DataFrame:
+    """
+    Load data once per day and column projection, and reuse it across tool calls.
+
+    The returned DataFrame is shared between callers and must be treated
+    as read-only.
+
+    Args:
+        date_str: ISO date the data belongs to, used as the cache key
+        columns: Columns to read from the file, or None to read all of them
+
+    Returns:
+        DataFrame with trading data
+    """
+    return _load_data(date_str, columns)
+
+
+def _canonical_column_groups(column_groups: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Normalize requested column categories into a stable cache key.
+
+    Repeats are dropped and categories are put in _COLUMN_GROUPS order, so any
+    ordering of the same request shares one projection and one cached frame.
+
+    Args:
+        column_groups: Column categories requested by the caller
+
+    Returns:
+        Unique column categories in _COLUMN_GROUPS order
+
+    Raises:
+        TradingViewError: If an unknown column category is requested
+    """
+    requested = set(column_groups)
+    unknown = requested.difference(_COLUMN_GROUPS)
+    if unknown:
+        raise TradingViewError(f"Unknown column categories: {sorted(unknown)}")
+
+    return tuple(group for group in _COLUMN_GROUPS if group in requested)
+
+
+# One entry per subset of _COLUMN_GROUPS at most, since keys are canonical
+@functools.lru_cache(maxsize=2 ** len(_COLUMN_GROUPS))
+def _projection_for(column_groups: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Resolve column categories into the ordered, de-duplicated columns to return.
+
+    Args:
+        column_groups: Canonical column categories from _canonical_column_groups
+
+    Returns:
+        Column names, starting with "name"
+    """
+    selected_columns = ["name"]
+    for column_group in column_groups:
+        selected_columns.extend(_COLUMN_GROUPS[column_group])
+
+    return tuple(dict.fromkeys(selected_columns))
+
+
 @mcp.tool()
 def get_stock_by_category(
     category: Literal["strong_buy", "buy", "sell", "strong_sell", "neutral"],
@@ -216,13 +466,16 @@ def get_stock_by_category(
         TradingViewError: If data loading or filtering fails
     """
     try:
-        df = _load_data()
+        df = _load_data_cached(
+            datetime.date.today().isoformat(), ("name", "recommendation_category")
+        )
 
-        filtered_df = df[df["recommendation_category"] == category]
+        mask = (df["recommendation_category"] == category).to_numpy()
 
-        return filtered_df[["name", "recommendation_category"]].to_dict(  # type: ignore
-            orient="records"
-        )
+        return [
+            {"name": name, "recommendation_category": category}
+            for name in df["name"].to_numpy()[mask]
+        ]
 
     except Exception as e:
         logger.error(f"Failed to filter stocks by category {category}: {e}")
@@ -258,29 +511,20 @@ def get_stock_values(
     Raises:
         TradingViewError: If data loading or filtering fails
     """
-    column_mapping = {
-        "basic_info": BASIC_INFO_COLUMNS,
-        "price": PRICE_COLUMNS,
-        "volume": VOLUME_COLUMNS,
-        "fundamental": FUNDAMENTAL_COLUMNS,
-        "technical": TECHNICAL_COLUMNS,
-        "performance": PERFORMANCE_COLUMNS,
-        "candlestick": CANDLESTICK_COLUMNS,
-        "recommendation": RECOMMENDATION_COLUMNS,
-    }
-
-    # Build selected columns list
-    selected_columns = []
-    for column_category in columns:
-        selected_columns.extend(column_mapping[column_category])  # type: ignore
+    projection = list(_projection_for(_canonical_column_groups(columns)))
 
     try:
-        df = _load_data()
+        df = _load_data_cached(datetime.date.today().isoformat(), tuple(projection))
 
         # Filter by tickers and select columns
-        filtered_df = df[df["name"].isin(tickers)][["name"] + selected_columns]  # type: ignore
+        mask = df["name"].isin(set(tickers)).to_numpy()
 
-        return filtered_df.to_dict("records")  # type: ignore
+        # The cached frame is laid out in projection order, so take columns by
+        # position; tolist() boxes cells to native Python types
+        column_values = [
+            df.iloc[:, i].to_numpy()[mask].tolist() for i in range(len(projection))
+        ]
+        return [dict(zip(projection, row)) for row in zip(*column_values)]
 
     except Exception as e:
         logger.error(f"Failed to get values for tickers {tickers}: {e}")
@@ -0,0 +1,187 @@
+import asyncio
+import math
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import mock
+
+import orjson
+
+from mcp_server import main
+from mcp_server.constants import COLUMNS
+
+TICKERS = [f"T{i}" for i in range(6)]
+RECOMMENDATIONS = [-1, -0.3, 0, 0.3, 0.8, None]
+STRING_COLUMNS = {
+    "description",
+    "logoid",
+    "exchange",
+    "market",
+    "sector",
+    "sector.tr",
+    "currency",
+    "fundamental_currency_code",
+    "type",
+    "update_mode",
+}
+
+
+def _api_rows() -> List[List[Any]]:
+    rows = []
+    for i, (ticker, recommendation) in enumerate(zip(TICKERS, RECOMMENDATIONS)):
+        cells: List[Any] = []
+        for j, column in enumerate(COLUMNS):
+            if column == "name":
+                cells.append(ticker)
+            elif column == "Recommend.All":
+                cells.append(recommendation)
+            elif column == "typespecs":
+                cells.append(["common"] if i % 2 else [])
+            elif column in STRING_COLUMNS:
+                cells.append(f"{column}-{i}")
+            else:
+                cells.append(None if (i + j) % 7 == 0 else i + j / 100)
+        rows.append(cells)
+    return rows
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self.content = body
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _fake_post(*args: Any, **kwargs: Any) -> _FakeResponse:
+    body = {"data": [{"s": f"NSE:{row[0]}", "d": row} for row in _api_rows()]}
+    return _FakeResponse(orjson.dumps(body))
+
+
+def _clear_caches() -> None:
+    main._temp_file_for.cache_clear()
+    main._load_data_cached.cache_clear()
+    main._fetch_dataframe_cached.cache_clear()
+
+
+class MainTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+        patchers = [
+            mock.patch.object(main, "TEMP_DIR", self.temp_dir),
+            mock.patch.object(main._SESSION, "post", side_effect=_fake_post),
+            # Keep fresh fetches in memory so each test controls the snapshot
+            mock.patch.object(main, "_save_to_parquet_in_background"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        _clear_caches()
+        self.addCleanup(_clear_caches)
+
+    def assertRecordsEqual(
+        self, first: List[Dict[str, Any]], second: List[Dict[str, Any]]
+    ) -> None:
+        """Compare records cell by cell and by type, treating NaN as equal."""
+        self.assertEqual(len(first), len(second))
+        for first_record, second_record in zip(first, second):
+            self.assertEqual(list(first_record), list(second_record))
+            for column, value in first_record.items():
+                other = second_record[column]
+                self.assertIs(type(value), type(other), column)
+                if isinstance(value, float) and math.isnan(value):
+                    self.assertTrue(math.isnan(other), column)
+                else:
+                    self.assertEqual(value, other, column)
+
+    def _call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        return asyncio.run(main.mcp.call_tool(name, arguments))
+
+    def _snapshot_path(self) -> Path:
+        return main._temp_file_for(main.datetime.date.today().isoformat())
+
+    def test_snapshot_round_trip_matches_fresh_fetch(self) -> None:
+        arguments = {
+            "tickers": TICKERS,
+            "columns": ["basic_info", "technical", "recommendation"],
+        }
+
+        fresh = main.get_stock_values(**arguments)
+        self.assertFalse(self._snapshot_path().exists())
+
+        main.fetch_trading_view_data()
+        _clear_caches()
+        self.assertTrue(self._snapshot_path().exists())
+
+        from_snapshot = main.get_stock_values(**arguments)
+
+        self.assertRecordsEqual(fresh, from_snapshot)
+        self.assertIsInstance(from_snapshot[1]["typespecs"], list)
+        self.assertEqual(from_snapshot[1]["typespecs"], ["common"])
+
+    def test_get_stock_values_serializes_from_snapshot(self) -> None:
+        main.fetch_trading_view_data()
+        _clear_caches()
+
+        # Raises ToolError if any cell cannot be serialized by FastMCP
+        self._call_tool(
+            "get_stock_values", {"tickers": ["T1"], "columns": ["basic_info"]}
+        )
+
+    def _assert_matches_to_dict(self, arguments: Dict[str, Any]) -> None:
+        records = main.get_stock_values(**arguments)
+
+        projection = main._projection_for(
+            main._canonical_column_groups(arguments["columns"])
+        )
+        df = main._load_data_cached(main.datetime.date.today().isoformat(), projection)
+        expected = df[df["name"].isin(arguments["tickers"])].to_dict("records")
+
+        self.assertRecordsEqual(expected, records)
+        self._call_tool("get_stock_values", arguments)
+
+    def test_get_stock_values_matches_to_dict_on_fresh_fetch(self) -> None:
+        self._assert_matches_to_dict(
+            {"tickers": ["T1", "T4"], "columns": ["basic_info", "price"]}
+        )
+        self.assertFalse(self._snapshot_path().exists())
+
+    def test_get_stock_values_matches_to_dict_from_snapshot(self) -> None:
+        main.fetch_trading_view_data()
+        _clear_caches()
+
+        self._assert_matches_to_dict(
+            {"tickers": ["T1", "T4"], "columns": ["basic_info", "price"]}
+        )
+
+    def test_column_group_orderings_share_cache_entries(self) -> None:
+        main._projection_for.cache_clear()
+
+        first = main.get_stock_values(["T1"], ["price", "basic_info"])
+        second = main.get_stock_values(["T1"], ["basic_info", "price", "price"])
+
+        self.assertRecordsEqual(first, second)
+        self.assertEqual(main._projection_for.cache_info().currsize, 1)
+        self.assertEqual(main._load_data_cached.cache_info().currsize, 1)
+
+    def test_unknown_column_group_is_rejected(self) -> None:
+        with self.assertRaises(main.TradingViewError):
+            main.get_stock_values(["T1"], ["price", "bogus"])  # type: ignore
+
+    def test_get_stock_by_category_matches_after_round_trip(self) -> None:
+        fresh = main.get_stock_by_category("buy")
+
+        main.fetch_trading_view_data()
+        _clear_caches()
+
+        self.assertEqual(fresh, [{"name": "T3", "recommendation_category": "buy"}])
+        self.assertEqual(fresh, main.get_stock_by_category("buy"))
+
+
+if __name__ == "__main__":
+    unittest.main()